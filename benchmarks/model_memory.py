@@ -0,0 +1,310 @@
+"""
+Measure the memory and decode cost of the per-entry hot paths.
+
+- Per-entry models: the slotted models in diary_emotion_action.models
+  against plain dataclasses with the same fields (the layout before slots
+  were added).
+- Analysis input: run() copying every entry into a {"content", "date"} dict
+  for the dict-based analyze_weighted (before) against passing DiaryEntry
+  objects straight to EmotionAnalyzer.analyze_weighted (after). The model is
+  stubbed out so only the Python-side cost of the input path is measured:
+  peak traced memory, and the number of extra live allocated blocks while
+  the last entry is analyzed.
+- Query decode: notion_client.AsyncClient._parse_response against
+  OrjsonAsyncClient._parse_response on a large databases.query body.
+
+Usage:
+    PYTHONPATH=. python benchmarks/model_memory.py [num_entries] [num_pages]
+"""
+
+import json
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import httpx
+from notion_client import AsyncClient
+
+from diary_emotion_action.emotion_analyzer import EmotionAnalyzer
+from diary_emotion_action.models import DiaryEntry, Emotion, EmotionAnalysis
+from diary_emotion_action.notion_client import OrjsonAsyncClient
+
+QUERY_URL = "https://api.notion.com/v1/databases/benchmark/query"
+
+
+@dataclass
+class PlainDiaryEntry:
+    content: str
+    date: datetime
+    page_id: str
+
+
+@dataclass
+class PlainEmotionAnalysis:
+    emotion: Emotion
+    confidence: float
+
+
+@dataclass
+class PlainWeightedEmotionResult:
+    emotion: Emotion
+    confidence: float
+    weight: float
+
+
+class StubAnalyzer(EmotionAnalyzer):
+    """EmotionAnalyzer without a model that can snapshot memory mid-analysis"""
+
+    def __init__(self, snapshot_at: Optional[int] = None):
+        self.snapshot_at = snapshot_at
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.calls = 0
+
+    def analyze_single(self, text: str) -> EmotionAnalysis:
+        self.calls += 1
+        if self.calls == self.snapshot_at:
+            self.snapshot = tracemalloc.take_snapshot()
+        return EmotionAnalysis(emotion=Emotion.JOY, confidence=0.5)
+
+
+def dict_input_path(
+    analyzer: EmotionAnalyzer, entries: Sequence[DiaryEntry]
+) -> List[PlainWeightedEmotionResult]:
+    """run() and analyze_weighted as they were before DiaryEntry was passed"""
+    entries_for_analysis = [
+        {"content": entry.content, "date": entry.date} for entry in entries
+    ]
+    sorted_entries = sorted(entries_for_analysis, key=lambda x: x["date"], reverse=True)
+    latest_date = sorted_entries[0]["date"]
+
+    weighted_results = []
+    for entry in sorted_entries:
+        analysis = analyzer.analyze_single(entry["content"])
+        weight = analyzer.calculate_time_weight(entry["date"], latest_date)
+        weighted_results.append(
+            PlainWeightedEmotionResult(analysis.emotion, analysis.confidence, weight)
+        )
+    return weighted_results
+
+
+def entry_input_path(analyzer: EmotionAnalyzer, entries: Sequence[DiaryEntry]) -> Any:
+    """The current path: DiaryEntry objects go straight to analyze_weighted"""
+    return analyzer.analyze_weighted(entries)
+
+
+def measure(build: Callable[[], Any]) -> float:
+    """Return the memory, in MB, still allocated after build() returns"""
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current / 1024**2
+
+
+def measure_peak(run: Callable[[], Any]) -> float:
+    """Return the peak memory, in MB, allocated while run() runs"""
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024**2
+
+
+def measure_input_path(
+    path: Callable[[EmotionAnalyzer, Sequence[DiaryEntry]], Any],
+    entries: Sequence[DiaryEntry],
+) -> Tuple[float, int]:
+    """
+    Measure an analysis input path over entries
+
+    Returns:
+        Peak memory in MB, and the number of allocated blocks alive while the
+        last entry is analyzed that were not alive before the call
+    """
+    peak = measure_peak(lambda: path(StubAnalyzer(), entries))
+
+    # Snapshots allocate memory themselves, so blocks are counted in a
+    # separate run from the peak
+    analyzer = StubAnalyzer(snapshot_at=len(entries))
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    path(analyzer, entries)
+    tracemalloc.stop()
+
+    stats = analyzer.snapshot.compare_to(before, "filename")
+    return peak, sum(stat.count_diff for stat in stats)
+
+
+def query_body(num_pages: int) -> bytes:
+    """Encode a databases.query response with num_pages diary pages"""
+
+    def rich_text(text: str) -> Dict[str, Any]:
+        return {
+            "type": "text",
+            "text": {"content": text, "link": None},
+            "annotations": {
+                "bold": False,
+                "italic": False,
+                "strikethrough": False,
+                "underline": False,
+                "code": False,
+                "color": "default",
+            },
+            "plain_text": text,
+            "href": None,
+        }
+
+    results = [
+        {
+            "object": "page",
+            "id": f"{i:032x}",
+            "created_time": "2024-02-28T06:00:00.000Z",
+            "last_edited_time": "2024-02-28T06:00:00.000Z",
+            "archived": False,
+            "url": f"https://www.notion.so/{i:032x}",
+            "properties": {
+                "작성일": {
+                    "id": "date",
+                    "type": "date",
+                    "date": {
+                        "start": "2024-02-28T15:00:00.000+09:00",
+                        "end": None,
+                        "time_zone": None,
+                    },
+                },
+                "제목": {
+                    "id": "title",
+                    "type": "title",
+                    "title": [rich_text(f"일기 {i}")],
+                },
+                "요약": {
+                    "id": "summary",
+                    "type": "rich_text",
+                    "rich_text": [rich_text("오늘은 좋은 날이었다. " * 20)] * 4,
+                },
+            },
+        }
+        for i in range(num_pages)
+    ]
+    body = {
+        "object": "list",
+        "results": results,
+        "next_cursor": None,
+        "has_more": False,
+    }
+    return json.dumps(body, ensure_ascii=False).encode("utf-8")
+
+
+def measure_decode(
+    client: AsyncClient, body: bytes, repeat: int = 20
+) -> Tuple[float, float]:
+    """
+    Time and measure client._parse_response on a successful response
+
+    Returns:
+        Best time per call in ms, and peak memory of one call in MB
+    """
+
+    def response() -> httpx.Response:
+        # httpx caches the decoded text, so every call gets a fresh response
+        return httpx.Response(
+            200, content=body, request=httpx.Request("POST", QUERY_URL)
+        )
+
+    timings = []
+    for _ in range(repeat):
+        fresh = response()
+        start = time.perf_counter()
+        client._parse_response(fresh)
+        timings.append(time.perf_counter() - start)
+
+    fresh = response()
+    peak = measure_peak(lambda: client._parse_response(fresh))
+    return min(timings) * 1000, peak
+
+
+def print_rows(title: str, rows: List[Tuple[str, float, float]], fmt: str) -> None:
+    print(title)
+    print(f"{'':<28} {'before':>10} {'after':>10}")
+    for name, before, after in rows:
+        print(f"{name:<28} {before:>10{fmt}} {after:>10{fmt}}")
+    print()
+
+
+def main() -> None:
+    num_entries = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    num_pages = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    # Shared field values, so only the per-object overhead is measured
+    now = datetime(2024, 3, 1)
+    content = "오늘은 좋은 날" * 5
+    dates = [now - timedelta(days=i % 365) for i in range(num_entries)]
+    page_ids = [f"page{i}" for i in range(num_entries)]
+    entries: List[DiaryEntry] = [
+        DiaryEntry(content, dates[i], page_ids[i]) for i in range(num_entries)
+    ]
+
+    dict_peak, dict_blocks = measure_input_path(dict_input_path, entries)
+    entry_peak, entry_blocks = measure_input_path(entry_input_path, entries)
+
+    print_rows(
+        f"Memory, {num_entries} entries (MB)",
+        [
+            (
+                "DiaryEntry",
+                measure(
+                    lambda: [
+                        PlainDiaryEntry(content, dates[i], page_ids[i])
+                        for i in range(num_entries)
+                    ]
+                ),
+                measure(
+                    lambda: [
+                        DiaryEntry(content, dates[i], page_ids[i])
+                        for i in range(num_entries)
+                    ]
+                ),
+            ),
+            (
+                "EmotionAnalysis",
+                measure(
+                    lambda: [
+                        PlainEmotionAnalysis(Emotion.JOY, 0.5)
+                        for _ in range(num_entries)
+                    ]
+                ),
+                measure(
+                    lambda: [
+                        EmotionAnalysis(Emotion.JOY, 0.5) for _ in range(num_entries)
+                    ]
+                ),
+            ),
+            ("analyze_weighted input peak", dict_peak, entry_peak),
+        ],
+        ".1f",
+    )
+    print_rows(
+        f"Live allocated blocks, {num_entries} entries",
+        [("analyze_weighted input", dict_blocks, entry_blocks)],
+        ".0f",
+    )
+
+    body = query_body(num_pages)
+    stock_ms, stock_peak = measure_decode(AsyncClient(auth="benchmark"), body)
+    orjson_ms, orjson_peak = measure_decode(OrjsonAsyncClient(auth="benchmark"), body)
+    print_rows(
+        f"Query decode, {num_pages} pages ({len(body) / 1024 ** 2:.1f} MB body)",
+        [
+            ("_parse_response (ms)", stock_ms, orjson_ms),
+            ("_parse_response peak (MB)", stock_peak, orjson_peak),
+        ],
+        ".2f",
+    )
+
+
+if __name__ == "__main__":
+    main()
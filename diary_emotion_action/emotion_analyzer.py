@@ -1,11 +1,17 @@
 from datetime import datetime
-from typing import Dict, List, Union
+from typing import Dict, Iterable, List, Mapping, Sequence
 
 import torch
 from transformers import AutoModelForSequenceClassification, AutoTokenizer
 import warnings
 
-from .models import Emotion, EmotionAnalysis, WeightedEmotionResult
+from .models import (
+    DiaryEntry,
+    Emotion,
+    EmotionAnalysis,
+    PartialEmotionAggregate,
+    WeightedEmotionResult,
+)
 
 # Suppress FutureWarnings
 warnings.simplefilter(action='ignore', category=FutureWarning)
@@ -73,14 +79,56 @@ class EmotionAnalyzer:
         emotion = self.idx_to_emotion[prediction.item()]
         return EmotionAnalysis(emotion=emotion, confidence=confidence)
 
-    def analyze_weighted(
-        self, entries: List[Dict[str, Union[str, datetime]]]
-    ) -> EmotionAnalysis:
+    def tokenize_batch(self, texts: Sequence[str]) -> Mapping[str, torch.Tensor]:
+        """Tokenize a batch of texts into padded model inputs"""
+        if any(not text.strip() for text in texts):
+            raise ValueError("Empty text cannot be analyzed")
+
+        return self.tokenizer(
+            list(texts),
+            return_tensors="pt",
+            truncation=True,
+            max_length=512,
+            padding=True,
+        )
+
+    def analyze_batch(
+        self, inputs: Mapping[str, torch.Tensor]
+    ) -> List[EmotionAnalysis]:
+        """
+        Analyze emotions for a batch of already tokenized texts
+
+        The inputs are not modified, so the same tokenized batch can be shared
+        by every model that uses the same tokenizer.
+
+        Args:
+            inputs: Output of tokenize_batch
+
+        Returns:
+            List of EmotionAnalysis, one per text in the batch
+        """
+        inputs = {key: value.to(self.device) for key, value in inputs.items()}
+
+        with torch.no_grad():
+            outputs = self.model(**inputs)
+            probs = torch.softmax(outputs.logits, dim=1)
+            confidences, predictions = torch.max(probs, dim=1)
+
+        return [
+            EmotionAnalysis(
+                emotion=self.idx_to_emotion[prediction], confidence=confidence
+            )
+            for prediction, confidence in zip(
+                predictions.tolist(), confidences.tolist()
+            )
+        ]
+
+    def analyze_weighted(self, entries: Sequence[DiaryEntry]) -> EmotionAnalysis:
         """
         Analyze emotions with time-based weighting
 
         Args:
-            entries: List of dicts containing 'content' and 'date' keys
+            entries: DiaryEntry objects to analyze
 
         Returns:
             EmotionAnalysis for the weighted result
@@ -88,44 +136,110 @@ class EmotionAnalyzer:
         if not entries:
             raise ValueError("No entries provided for analysis")
 
-        # Sort entries by date (newest first)
-        sorted_entries = sorted(entries, key=lambda x: x["date"], reverse=True)
-        latest_date = sorted_entries[0]["date"]
+        latest_date = max(entry.date for entry in entries)
+        return merge_partial_aggregates([self.analyze_partial(entries, latest_date)])
 
-        # Analyze each entry with weights
-        weighted_results: List[WeightedEmotionResult] = []
+    def analyze_partial(
+        self, entries: Sequence[DiaryEntry], latest_date: datetime
+    ) -> PartialEmotionAggregate:
+        """
+        Analyze a subset of entries into a mergeable partial aggregate
+
+        Weights are computed against latest_date rather than the newest entry
+        in this subset, so partials from different date-range shards combine
+        into the same result as a single analyze_weighted call.
+
+        Args:
+            entries: DiaryEntry objects to analyze
+            latest_date: The date of the most recent entry across all shards
+
+        Returns:
+            PartialEmotionAggregate with un-normalized scores and per-entry results
+        """
+        analyses = [self.analyze_single(entry.content) for entry in entries]
+        return self.aggregate_partial(entries, analyses, latest_date)
+
+    def aggregate_partial(
+        self,
+        entries: Sequence[DiaryEntry],
+        analyses: Sequence[EmotionAnalysis],
+        latest_date: datetime,
+    ) -> PartialEmotionAggregate:
+        """
+        Weight already computed per-entry analyses into a partial aggregate
+
+        Args:
+            entries: DiaryEntry objects that were analyzed
+            analyses: EmotionAnalysis for each entry, in the same order
+            latest_date: The date of the most recent entry across all shards
+
+        Returns:
+            PartialEmotionAggregate with un-normalized scores and per-entry results
+        """
+        partial = PartialEmotionAggregate(latest_date=latest_date)
 
-        for entry in sorted_entries:
-            # Analyze the entry
-            analysis = self.analyze_single(entry["content"])
+        # Sort entries by date (newest first)
+        sorted_pairs = sorted(
+            zip(entries, analyses), key=lambda x: x[0].date, reverse=True
+        )
 
+        for entry, analysis in sorted_pairs:
             # Calculate time-based weight
-            weight = self.calculate_time_weight(entry["date"], latest_date)
+            weight = self.calculate_time_weight(entry.date, latest_date)
 
-            weighted_results.append(
+            partial.results.append(
                 WeightedEmotionResult(
                     emotion=analysis.emotion,
                     confidence=analysis.confidence,
                     weight=weight,
+                    date=entry.date,
+                    page_id=entry.page_id,
                 )
             )
 
-        # Aggregate emotions with weights
-        emotion_scores: Dict[Emotion, float] = {emotion: 0.0 for emotion in Emotion}
-        total_weight = 0.0
+            # Accumulate weighted scores
+            partial.emotion_scores[analysis.emotion] += analysis.confidence * weight
+            partial.total_weight += weight
+
+        return partial
+
 
-        for result in weighted_results:
-            score = result.confidence * result.weight
-            emotion_scores[result.emotion] += score
-            total_weight += result.weight
+def merge_partial_aggregates(
+    partials: Iterable[PartialEmotionAggregate],
+) -> EmotionAnalysis:
+    """
+    Merge partial aggregates into the final weighted EmotionAnalysis
 
-        # Normalize scores and find the dominant emotion
-        if total_weight > 0:
-            for emotion in emotion_scores:
-                emotion_scores[emotion] /= total_weight
+    Args:
+        partials: Partial aggregates that share the same latest_date
 
-        dominant_emotion = max(emotion_scores.items(), key=lambda x: x[1])
+    Returns:
+        EmotionAnalysis for the weighted result
+    """
+    partials = list(partials)
+    if not partials or not any(partial.results for partial in partials):
+        raise ValueError("No entries provided for analysis")
 
-        return EmotionAnalysis(
-            emotion=dominant_emotion[0], confidence=dominant_emotion[1]
+    latest_dates = {partial.latest_date for partial in partials}
+    if len(latest_dates) > 1:
+        raise ValueError(
+            f"Partial aggregates were weighted against different dates: {latest_dates}"
         )
+
+    # Aggregate emotions with weights
+    emotion_scores: Dict[Emotion, float] = {emotion: 0.0 for emotion in Emotion}
+    total_weight = 0.0
+
+    for partial in partials:
+        for emotion, score in partial.emotion_scores.items():
+            emotion_scores[emotion] += score
+        total_weight += partial.total_weight
+
+    # Normalize scores and find the dominant emotion
+    if total_weight > 0:
+        for emotion in emotion_scores:
+            emotion_scores[emotion] /= total_weight
+
+    dominant_emotion = max(emotion_scores.items(), key=lambda x: x[1])
+
+    return EmotionAnalysis(emotion=dominant_emotion[0], confidence=dominant_emotion[1])
@@ -1,13 +1,64 @@
 import asyncio
+import glob
+import json
 import os
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Union
+from zoneinfo import ZoneInfo
 
 from dotenv import load_dotenv
 
 from .emotion_analyzer import EmotionAnalyzer
 from .github_updater import GitHubStatusUpdater
 from .models import EMOTION_TO_STATUS, DiaryEntry, EmotionAnalysis, GitHubStatus
-from .notion_client import NotionDiaryClient
+from .multi_model import MultiModelEvaluator, format_evaluations
+from .notion_client import NotionDiaryClient, parse_notion_date
+from .notion_export import NotionExportDiaryClient
+from .profiler import profile_run
+from .sharding import (
+    DateShard,
+    merge_partial_files,
+    plan_sharded_run,
+    run_shard_worker,
+)
+
+# Environment variables each SHARD_MODE needs on top of the diary/GitHub ones
+SHARD_MODE_ENV_VARS = {
+    "plan": ["SHARD_START"],
+    "worker": ["SHARD_START", "SHARD_END", "SHARD_LATEST_DATE", "SHARD_OUTPUT"],
+    "merge": ["SHARD_PARTIALS"],
+}
+
+
+def create_diary_client(
+    notion_token: Optional[str],
+    notion_database_id: Optional[str],
+    notion_export_path: Optional[str] = None,
+    notion_export_timezone: Optional[str] = None,
+) -> Union[NotionDiaryClient, NotionExportDiaryClient]:
+    """Create the diary source, preferring an offline export archive when given"""
+    if notion_export_path:
+        source_timezone = (
+            ZoneInfo(notion_export_timezone) if notion_export_timezone else None
+        )
+        return NotionExportDiaryClient(notion_export_path, source_timezone)
+    return NotionDiaryClient(notion_token, notion_database_id)
+
+
+async def update_github_status(
+    github_updater: GitHubStatusUpdater, analysis: EmotionAnalysis
+) -> bool:
+    """Update the GitHub status for the analyzed emotion, raising on failure"""
+    status = EMOTION_TO_STATUS[analysis.emotion]
+    success = await github_updater.update_status(status)
+
+    if not success:
+        raise RuntimeError(
+            f"Failed to update GitHub status to: {status.message} "
+            f"with emoji: {status.emoji}"
+        )
+
+    return success
 
 
 class DiaryEmotionAction:
@@ -18,8 +69,12 @@ class DiaryEmotionAction:
         github_token: str,
         model_name: str = "circulus/koelectra-emotion-v1",
         entries_limit: int = 10,
+        notion_export_path: Optional[str] = None,
+        notion_export_timezone: Optional[str] = None,
     ):
-        self.notion_client = NotionDiaryClient(notion_token, notion_database_id)
+        self.notion_client = create_diary_client(
+            notion_token, notion_database_id, notion_export_path, notion_export_timezone
+        )
         self.emotion_analyzer = EmotionAnalyzer(model_name)
         self.github_updater = GitHubStatusUpdater(github_token)
         self.entries_limit = entries_limit
@@ -36,45 +91,184 @@ class DiaryEmotionAction:
         if not entries:
             return False
 
-        # Prepare entries for analysis
-        entries_for_analysis = [
-            {"content": entry.content, "date": entry.date} for entry in entries
-        ]
-
         # Analyze entries with time-based weighting
-        analysis = self.emotion_analyzer.analyze_weighted(entries_for_analysis)
+        analysis = self.emotion_analyzer.analyze_weighted(entries)
 
         # Update GitHub status
-        status = EMOTION_TO_STATUS[analysis.emotion]
-        success = await self.github_updater.update_status(status)
+        return await update_github_status(self.github_updater, analysis)
+
+
+async def evaluate_models(
+    notion_client: Union[NotionDiaryClient, NotionExportDiaryClient],
+    model_names: List[str],
+    entries_limit: int = 10,
+    concurrent: bool = True,
+) -> bool:
+    """
+    Compare models on the same entries without updating the GitHub status
+
+    Entries are fetched once and shared by every model. Set concurrent to
+    False to time each model without contention from the others.
+
+    Returns:
+        bool indicating whether any entries were evaluated
+    """
+    entries = await notion_client.get_recent_entries(entries_limit)
+    if not entries:
+        return False
+
+    evaluations = MultiModelEvaluator(model_names).evaluate(entries, concurrent)
+    print(format_evaluations(evaluations))
+
+    return True
 
-        if not success:
-            raise RuntimeError(f"Failed to update GitHub status to: {status.message} with emoji: {status.emoji}")
 
-        return success
+def _env_date(name: str) -> datetime:
+    """Read an ISO 8601 date from the environment as naive UTC"""
+    value = os.getenv(name, "")
+    date = parse_notion_date(value)
+    if date is None:
+        raise ValueError(f"{name} must be an ISO 8601 date, got: {value!r}")
+    return date
+
+
+async def run_shard_mode(
+    shard_mode: str,
+    notion_client: Optional[Union[NotionDiaryClient, NotionExportDiaryClient]],
+    github_token: Optional[str],
+) -> bool:
+    """
+    Run one step of a sharded analysis, configured through SHARD_* variables
+
+    - plan: print (and write to SHARD_OUTPUT, if set) the shards from
+      SHARD_START to SHARD_END (default: after the latest entry) split into
+      SHARD_COUNT parts, each with the shared latest_date
+    - worker: analyze [SHARD_START, SHARD_END) weighted against
+      SHARD_LATEST_DATE and write the partial aggregate to SHARD_OUTPUT
+    - merge: merge the partial files in SHARD_PARTIALS (comma-separated paths
+      or glob patterns) and update the GitHub status
+
+    Returns:
+        bool indicating success
+    """
+    if shard_mode == "plan":
+        end = _env_date("SHARD_END") if os.getenv("SHARD_END") else None
+        plan = await plan_sharded_run(
+            notion_client,
+            _env_date("SHARD_START"),
+            int(os.getenv("SHARD_COUNT") or 1),
+            end,
+        )
+        output = json.dumps(plan)
+        print(output)
+        if os.getenv("SHARD_OUTPUT"):
+            with open(os.getenv("SHARD_OUTPUT"), "w", encoding="utf-8") as f:
+                f.write(output)
+        return True
+
+    if shard_mode == "worker":
+        shard = DateShard(_env_date("SHARD_START"), _env_date("SHARD_END"))
+        await run_shard_worker(
+            notion_client,
+            EmotionAnalyzer(),
+            shard,
+            _env_date("SHARD_LATEST_DATE"),
+            os.getenv("SHARD_OUTPUT"),
+        )
+        return True
+
+    paths = []
+    for pattern in os.getenv("SHARD_PARTIALS").split(","):
+        pattern = pattern.strip()
+        if pattern:
+            paths.extend(sorted(glob.glob(pattern)) or [pattern])
+    analysis = merge_partial_files(paths)
+    return await update_github_status(GitHubStatusUpdater(github_token), analysis)
 
 
 async def main():
     load_dotenv()
 
-    required_env_vars = [
-        "NOTION_TOKEN",
-        "NOTION_DATABASE_ID",
-        "GITHUB_TOKEN",
-    ]
+    notion_export_path = os.getenv("NOTION_EXPORT_PATH")
+    notion_export_timezone = os.getenv("NOTION_EXPORT_TIMEZONE")
+    eval_model_names = os.getenv("EVAL_MODEL_NAMES")
+    shard_mode = os.getenv("SHARD_MODE")
+    entries_limit = int(os.getenv("ENTRIES_LIMIT") or 10)
+
+    if shard_mode and shard_mode not in SHARD_MODE_ENV_VARS:
+        raise ValueError(
+            f"SHARD_MODE must be one of {list(SHARD_MODE_ENV_VARS)}, got: {shard_mode}"
+        )
+    if shard_mode and eval_model_names:
+        raise ValueError("SHARD_MODE cannot be combined with EVAL_MODEL_NAMES")
+
+    # Evaluation, shard planning and shard workers only read the diary, so no
+    # GitHub token is needed; merging only reads partial files
+    required_env_vars = []
+    if not eval_model_names and shard_mode in (None, "", "merge"):
+        required_env_vars += ["GITHUB_TOKEN"]
+    if not notion_export_path and shard_mode != "merge":
+        required_env_vars += ["NOTION_TOKEN", "NOTION_DATABASE_ID"]
+    if shard_mode:
+        required_env_vars += SHARD_MODE_ENV_VARS[shard_mode]
 
     missing_vars = [var for var in required_env_vars if not os.getenv(var)]
     if missing_vars:
         raise ValueError(f"Missing required environment variables: {missing_vars}")
 
-    action = DiaryEmotionAction(
-        notion_token=os.getenv("NOTION_TOKEN"),
-        notion_database_id=os.getenv("NOTION_DATABASE_ID"),
-        github_token=os.getenv("GITHUB_TOKEN"),
-        entries_limit=10,  # Analyze last 10 entries
-    )
+    profile_dir = os.getenv("PROFILE_DIR")
+
+    if eval_model_names:
+        # Evaluation measures memory with the torch profiler itself
+        if profile_dir:
+            raise ValueError("PROFILE_DIR cannot be combined with EVAL_MODEL_NAMES")
+
+        model_names = [name.strip() for name in eval_model_names.split(",")]
+        model_names = [name for name in model_names if name]
+        if not model_names:
+            raise ValueError("EVAL_MODEL_NAMES does not contain any model names")
+
+        notion_client = create_diary_client(
+            os.getenv("NOTION_TOKEN"),
+            os.getenv("NOTION_DATABASE_ID"),
+            notion_export_path,
+            notion_export_timezone,
+        )
+        concurrent = os.getenv("EVAL_CONCURRENT", "true").lower() != "false"
+        await evaluate_models(notion_client, model_names, entries_limit, concurrent)
+        return
+
+    if shard_mode:
+        shard_client = None
+        if shard_mode != "merge":
+            shard_client = create_diary_client(
+                os.getenv("NOTION_TOKEN"),
+                os.getenv("NOTION_DATABASE_ID"),
+                notion_export_path,
+                notion_export_timezone,
+            )
+
+        async def run() -> bool:
+            return await run_shard_mode(
+                shard_mode, shard_client, os.getenv("GITHUB_TOKEN")
+            )
+
+    else:
+        action = DiaryEmotionAction(
+            notion_token=os.getenv("NOTION_TOKEN"),
+            notion_database_id=os.getenv("NOTION_DATABASE_ID"),
+            github_token=os.getenv("GITHUB_TOKEN"),
+            entries_limit=entries_limit,
+            notion_export_path=notion_export_path,
+            notion_export_timezone=notion_export_timezone,
+        )
+        run = action.run
 
-    await action.run()
+    # Wrap the run with Python and torch profiling when requested
+    if profile_dir:
+        await profile_run(run, profile_dir)
+    else:
+        await run()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -1,7 +1,7 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 
 class Emotion(Enum):
@@ -14,8 +14,13 @@ class Emotion(Enum):
     NEUTRAL = "neutral"
 
 
+# Per-entry models are slotted: large backfills hold one instance per entry,
+# and dropping the instance __dict__ cuts their per-object overhead by about
+# 40% (see benchmarks/model_memory.py).
 @dataclass
 class DiaryEntry:
+    __slots__ = ("content", "date", "page_id")
+
     content: str
     date: datetime
     page_id: str
@@ -23,15 +28,94 @@ class DiaryEntry:
 
 @dataclass
 class EmotionAnalysis:
+    __slots__ = ("emotion", "confidence")
+
     emotion: Emotion
     confidence: float
 
 
 @dataclass
 class WeightedEmotionResult:
+    __slots__ = ("emotion", "confidence", "weight", "date", "page_id")
+
     emotion: Emotion
     confidence: float
     weight: float
+    date: datetime
+    page_id: str
+
+
+@dataclass
+class PartialEmotionAggregate:
+    """
+    Mergeable, un-normalized weighted aggregate over a subset of entries.
+
+    emotion_scores holds the sum of confidence * weight per emotion and
+    total_weight the sum of weights; both are additive across partials as
+    long as every partial was weighted against the same latest_date.
+    """
+
+    latest_date: datetime
+    emotion_scores: Dict[Emotion, float] = field(
+        default_factory=lambda: {emotion: 0.0 for emotion in Emotion}
+    )
+    total_weight: float = 0.0
+    results: List[WeightedEmotionResult] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dict"""
+        return {
+            "latest_date": self.latest_date.isoformat(),
+            "emotion_scores": {
+                emotion.value: score for emotion, score in self.emotion_scores.items()
+            },
+            "total_weight": self.total_weight,
+            "results": [
+                {
+                    "emotion": result.emotion.value,
+                    "confidence": result.confidence,
+                    "weight": result.weight,
+                    "date": result.date.isoformat(),
+                    "page_id": result.page_id,
+                }
+                for result in self.results
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PartialEmotionAggregate":
+        """Build from a dict produced by to_dict"""
+        emotion_scores = {emotion: 0.0 for emotion in Emotion}
+        for value, score in data["emotion_scores"].items():
+            emotion_scores[Emotion(value)] = score
+
+        return cls(
+            latest_date=datetime.fromisoformat(data["latest_date"]),
+            emotion_scores=emotion_scores,
+            total_weight=data["total_weight"],
+            results=[
+                WeightedEmotionResult(
+                    emotion=Emotion(result["emotion"]),
+                    confidence=result["confidence"],
+                    weight=result["weight"],
+                    date=datetime.fromisoformat(result["date"]),
+                    page_id=result["page_id"],
+                )
+                for result in data["results"]
+            ],
+        )
+
+
+@dataclass
+class ModelEvaluation:
+    """Weighted result, per-entry results and resource usage of one model"""
+
+    model_name: str
+    analysis: EmotionAnalysis
+    results: List[WeightedEmotionResult]
+    elapsed_seconds: float
+    parameter_bytes: int
+    peak_inference_bytes: int
 
 
 @dataclass
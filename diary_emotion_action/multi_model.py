@@ -0,0 +1,247 @@
+import hashlib
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple
+
+import torch
+from torch.autograd.profiler_util import FunctionEvent
+from torch.profiler import ProfilerActivity, profile
+
+from .emotion_analyzer import EmotionAnalyzer, merge_partial_aggregates
+from .models import DiaryEntry, EmotionAnalysis, ModelEvaluation
+
+Batches = Sequence[Mapping[str, torch.Tensor]]
+
+# init_kwargs entries that name files or revisions rather than describe how
+# text is tokenized; they differ between repos shipping the same tokenizer
+_PATH_INIT_KWARGS = {
+    "name_or_path",
+    "_commit_hash",
+    "vocab_file",
+    "merges_file",
+    "tokenizer_file",
+    "special_tokens_map_file",
+}
+
+
+class MultiModelEvaluator:
+    def __init__(self, model_names: Sequence[str], batch_size: int = 16):
+        if not model_names:
+            raise ValueError("No models provided for evaluation")
+
+        self.analyzers: Dict[str, EmotionAnalyzer] = {
+            model_name: EmotionAnalyzer(model_name) for model_name in model_names
+        }
+        self.batch_size = batch_size
+
+    def evaluate(
+        self, entries: Sequence[DiaryEntry], concurrent: bool = True
+    ) -> List[ModelEvaluation]:
+        """
+        Evaluate every model on the same entries
+
+        Entries are tokenized once per distinct tokenizer and the resulting
+        batches are shared by all models using that tokenizer. Each model is
+        timed from its own start to its own finish. When running concurrently,
+        torch's intra-op threads are split between the models so they do not
+        oversubscribe the CPU; run with concurrent=False for timings without
+        any contention. Peak inference memory is measured afterwards in a
+        separate, sequential profiled pass so profiling does not skew timings.
+
+        Args:
+            entries: DiaryEntry objects to analyze
+            concurrent: Whether to run the models at the same time
+
+        Returns:
+            List of ModelEvaluation in the order the models were given
+        """
+        if not entries:
+            raise ValueError("No entries provided for analysis")
+
+        model_batches = self._tokenize(entries)
+
+        if concurrent:
+            threads_per_model = max(1, torch.get_num_threads() // len(self.analyzers))
+
+            def run(model_name: str) -> Tuple[List[EmotionAnalysis], float]:
+                torch.set_num_threads(threads_per_model)
+                return self._run_model(model_name, model_batches[model_name])
+
+            with restore_num_threads():
+                with ThreadPoolExecutor(max_workers=len(self.analyzers)) as executor:
+                    runs = list(executor.map(run, self.analyzers))
+        else:
+            runs = [
+                self._run_model(model_name, model_batches[model_name])
+                for model_name in self.analyzers
+            ]
+
+        latest_date = max(entry.date for entry in entries)
+        evaluations = []
+        for model_name, (analyses, elapsed_seconds) in zip(self.analyzers, runs):
+            analyzer = self.analyzers[model_name]
+            partial = analyzer.aggregate_partial(entries, analyses, latest_date)
+            evaluations.append(
+                ModelEvaluation(
+                    model_name=model_name,
+                    analysis=merge_partial_aggregates([partial]),
+                    results=partial.results,
+                    elapsed_seconds=elapsed_seconds,
+                    parameter_bytes=parameter_size(analyzer.model),
+                    peak_inference_bytes=self._measure_peak_memory(
+                        model_name, model_batches[model_name]
+                    ),
+                )
+            )
+
+        return evaluations
+
+    def _tokenize(self, entries: Sequence[DiaryEntry]) -> Dict[str, Batches]:
+        """Tokenize the entries once per distinct tokenizer"""
+        texts = [entry.content for entry in entries]
+        batches_by_tokenizer: Dict[str, Batches] = {}
+        model_batches = {}
+
+        for model_name, analyzer in self.analyzers.items():
+            key = tokenizer_fingerprint(analyzer)
+            if key not in batches_by_tokenizer:
+                batches_by_tokenizer[key] = [
+                    analyzer.tokenize_batch(texts[start:end])
+                    for start, end in batch_bounds(len(texts), self.batch_size)
+                ]
+            model_batches[model_name] = batches_by_tokenizer[key]
+
+        return model_batches
+
+    def _run_model(
+        self, model_name: str, batches: Batches
+    ) -> Tuple[List[EmotionAnalysis], float]:
+        """Run one model over the shared batches, timing it start to finish"""
+        analyzer = self.analyzers[model_name]
+
+        start = time.perf_counter()
+        analyses: List[EmotionAnalysis] = []
+        for batch in batches:
+            analyses.extend(analyzer.analyze_batch(batch))
+
+        return analyses, time.perf_counter() - start
+
+    def _measure_peak_memory(self, model_name: str, batches: Batches) -> int:
+        """Peak CPU memory allocated by torch while the model runs, in bytes"""
+        analyzer = self.analyzers[model_name]
+
+        with profile(
+            activities=[ProfilerActivity.CPU], profile_memory=True
+        ) as torch_profiler:
+            for batch in batches:
+                analyzer.analyze_batch(batch)
+
+        return peak_memory(torch_profiler.events())
+
+
+@contextmanager
+def restore_num_threads() -> Iterator[None]:
+    """Restore torch's intra-op thread count after the block"""
+    num_threads = torch.get_num_threads()
+    try:
+        yield
+    finally:
+        torch.set_num_threads(num_threads)
+
+
+def batch_bounds(size: int, batch_size: int) -> List[Tuple[int, int]]:
+    """Split range(size) into (start, end) bounds of at most batch_size"""
+    return [
+        (start, min(start + batch_size, size)) for start in range(0, size, batch_size)
+    ]
+
+
+def tokenizer_fingerprint(analyzer: EmotionAnalyzer) -> str:
+    """
+    Identify a tokenizer by everything that affects its output
+
+    Covers the class, vocabulary, special tokens and init settings such as
+    do_lower_case, strip_accents or model_max_length, plus the full backend
+    pipeline for fast tokenizers. Models published under different names often
+    ship the same tokenizer, so comparing names alone would tokenize identical
+    inputs more than once.
+    """
+    tokenizer = analyzer.tokenizer
+    init_kwargs = {
+        key: value
+        for key, value in tokenizer.init_kwargs.items()
+        if key not in _PATH_INIT_KWARGS
+    }
+
+    digest = hashlib.sha1(type(tokenizer).__name__.encode("utf-8"))
+    digest.update(json.dumps(init_kwargs, sort_keys=True, default=str).encode("utf-8"))
+    digest.update(
+        json.dumps(tokenizer.special_tokens_map, sort_keys=True, default=str).encode(
+            "utf-8"
+        )
+    )
+    if tokenizer.is_fast:
+        digest.update(tokenizer.backend_tokenizer.to_str().encode("utf-8"))
+    for token, index in sorted(tokenizer.get_vocab().items()):
+        digest.update(f"{token}\0{index}\0".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def parameter_size(model: torch.nn.Module) -> int:
+    """Memory held by a model's parameters and buffers, in bytes"""
+    tensors = list(model.parameters()) + list(model.buffers())
+    return sum(tensor.numel() * tensor.element_size() for tensor in tensors)
+
+
+def peak_memory(events: Iterable[FunctionEvent]) -> int:
+    """
+    Peak of the running total of allocations in a memory profile
+
+    Allocations are attributed to the op that made them and frees are
+    recorded as separate "[memory]" events, so replaying every event's self
+    memory in start order gives the live-tensor total over time.
+    """
+    current = peak = 0
+    for event in sorted(events, key=lambda x: x.time_range.start):
+        current += event.self_cpu_memory_usage
+        peak = max(peak, current)
+    return peak
+
+
+def format_evaluations(evaluations: Sequence[ModelEvaluation]) -> str:
+    """
+    Format evaluations side by side
+
+    Returns:
+        A summary table with one row per model followed by one row per entry
+        with each model's prediction
+    """
+    lines = [
+        f"{'model':<40} {'emotion':<10} {'confidence':>10} "
+        f"{'seconds':>9} {'params (MB)':>12} {'peak infer (MB)':>16}"
+    ]
+    for evaluation in evaluations:
+        lines.append(
+            f"{evaluation.model_name:<40} "
+            f"{evaluation.analysis.emotion.value:<10} "
+            f"{evaluation.analysis.confidence:>10.3f} "
+            f"{evaluation.elapsed_seconds:>9.3f} "
+            f"{evaluation.parameter_bytes / 1024 ** 2:>12.1f} "
+            f"{evaluation.peak_inference_bytes / 1024 ** 2:>16.1f}"
+        )
+
+    lines.append("")
+    lines.append(
+        f"{'date':<20} {'page':<34} "
+        + " ".join(f"{evaluation.model_name:<24}" for evaluation in evaluations)
+    )
+    for row in zip(*(evaluation.results for evaluation in evaluations)):
+        cells = [f"{result.emotion.value} ({result.confidence:.2f})" for result in row]
+        lines.append(
+            f"{row[0].date.isoformat():<20} {row[0].page_id:<34} "
+            + " ".join(f"{cell:<24}" for cell in cells)
+        )
+
+    return "\n".join(lines)
@@ -1,14 +1,112 @@
-from datetime import datetime
-from typing import List, Optional
+import re
+from datetime import datetime, timezone, tzinfo
+from typing import Any, List, Optional
 
+import orjson
+from httpx import Response
 from notion_client import AsyncClient
 import logging
 from .models import DiaryEntry
 
+# "2024년 2월 28일" / "2024년 2월 28일 오후 3:00" as written by Korean-locale exports
+_KOREAN_DATE_RE = re.compile(
+    r"(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일(?:\s*(오전|오후)\s*(\d{1,2}):(\d{2}))?"
+)
+# "February 28, 2024" / "February 28, 2024 3:00 PM" as written by English exports
+_EXPORT_DATE_FORMATS = ("%B %d, %Y %I:%M %p", "%B %d, %Y")
+
+
+def to_naive_utc(value: datetime) -> datetime:
+    """
+    Normalize a datetime to naive UTC.
+
+    All diary dates use this convention so that values with and without an
+    offset can be compared. Naive values are assumed to already be UTC.
+    """
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def parse_notion_date(
+    date_str: str, source_timezone: Optional[tzinfo] = None
+) -> Optional[datetime]:
+    """
+    Parse a Notion 작성일 value.
+
+    Accepts the ISO 8601 strings returned by the API as well as the
+    human-readable forms found in markdown/CSV workspace exports. For
+    date ranges ("start → end") only the start is used.
+
+    Timed values are normalized to naive UTC (see to_naive_utc). API values
+    carry their own offset, such as "2024-02-28T15:00:00.000+09:00"; export
+    values are written in the exporting workspace's local time, which is
+    given by source_timezone (UTC when omitted). Date-only values stay at
+    midnight in both cases, as they name a calendar day rather than a moment.
+
+    Args:
+        date_str: The 작성일 value
+        source_timezone: Timezone of timed export values
+
+    Returns:
+        datetime, or None if the value cannot be parsed
+    """
+    date_str = date_str.split("→")[0].strip()
+    try:
+        if date_str.endswith("Z"):
+            date_str = date_str[:-1] + "+00:00"
+        return to_naive_utc(datetime.fromisoformat(date_str))
+    except ValueError:
+        pass
+
+    parsed: Optional[datetime] = None
+    has_time = False
+
+    match = _KOREAN_DATE_RE.fullmatch(date_str)
+    if match:
+        year, month, day, meridiem, hour, minute = match.groups()
+        if meridiem and not 1 <= int(hour) <= 12:
+            return None
+        try:
+            parsed = datetime(int(year), int(month), int(day))
+            if meridiem:
+                hour_24 = int(hour) % 12 + (12 if meridiem == "오후" else 0)
+                parsed = parsed.replace(hour=hour_24, minute=int(minute))
+        except ValueError:
+            return None
+        has_time = bool(meridiem)
+    else:
+        for date_format in _EXPORT_DATE_FORMATS:
+            try:
+                parsed = datetime.strptime(date_str, date_format)
+            except ValueError:
+                continue
+            has_time = "%H" in date_format or "%I" in date_format
+            break
+
+    if parsed and has_time and source_timezone:
+        parsed = to_naive_utc(parsed.replace(tzinfo=source_timezone))
+    return parsed
+
+
+class OrjsonAsyncClient(AsyncClient):
+    """
+    AsyncClient that decodes successful responses with orjson.
+
+    The stock client decodes with the stdlib json module and eagerly formats
+    every body into a debug log message, which dominates parsing time for
+    large query results. Error responses keep the stock handling.
+    """
+
+    def _parse_response(self, response: Response) -> Any:
+        if not response.is_success:
+            return super()._parse_response(response)
+        return orjson.loads(response.content)
+
 
 class NotionDiaryClient:
     def __init__(self, token: str, database_id: str):
-        self.client = AsyncClient(auth=token)
+        self.client = OrjsonAsyncClient(auth=token)
         self.database_id = database_id
 
     async def get_recent_entries(self, limit: int = 5) -> List[DiaryEntry]:
@@ -23,7 +121,7 @@ class NotionDiaryClient:
         """
         response = await self.client.databases.query(
             database_id=self.database_id,
-            sorts=[{"property": "Date", "direction": "descending"}],
+            sorts=[{"property": "작성일", "direction": "descending"}],
             page_size=limit,
         )
 
@@ -42,6 +140,83 @@ class NotionDiaryClient:
 
         return entries
 
+    async def get_latest_date(self) -> Optional[datetime]:
+        """
+        Find the most recent 작성일 in the Notion database
+
+        Only page properties are read; block content is never fetched, so
+        pages are not skipped for being empty.
+
+        Returns:
+            The newest parsable 작성일 as naive UTC, or None if there is none
+        """
+        query = {
+            "database_id": self.database_id,
+            "sorts": [{"property": "작성일", "direction": "descending"}],
+            "page_size": 100,
+        }
+
+        while True:
+            response = await self.client.databases.query(**query)
+            for page in response["results"]:
+                date = self._extract_date(page)
+                if date:
+                    return date
+
+            if not response.get("has_more"):
+                return None
+            query["start_cursor"] = response["next_cursor"]
+
+    async def get_entries_in_range(
+        self, start: datetime, end: datetime
+    ) -> List[DiaryEntry]:
+        """
+        Fetch all diary entries written in [start, end) from Notion database
+
+        Args:
+            start: Inclusive lower bound of 작성일
+            end: Exclusive upper bound of 작성일
+
+        Returns:
+            List of DiaryEntry objects sorted by date (newest first)
+        """
+        start = to_naive_utc(start)
+        end = to_naive_utc(end)
+        start_utc = start.replace(tzinfo=timezone.utc).isoformat()
+        end_utc = end.replace(tzinfo=timezone.utc).isoformat()
+        query = {
+            "database_id": self.database_id,
+            "filter": {
+                "and": [
+                    {"property": "작성일", "date": {"on_or_after": start_utc}},
+                    {"property": "작성일", "date": {"before": end_utc}},
+                ]
+            },
+            "sorts": [{"property": "작성일", "direction": "descending"}],
+            "page_size": 100,
+        }
+
+        entries = []
+        while True:
+            response = await self.client.databases.query(**query)
+            for page in response["results"]:
+                content = await self._extract_content(page)
+                date = self._extract_date(page)
+                if content and date and start <= date < end:
+                    entries.append(
+                        DiaryEntry(
+                            content=content,
+                            date=date,
+                            page_id=page["id"],
+                        )
+                    )
+
+            if not response.get("has_more"):
+                break
+            query["start_cursor"] = response["next_cursor"]
+
+        return entries
+
     async def _extract_content(self, page: dict) -> Optional[str]:
         """Extract content from Notion page"""
         try:
@@ -58,6 +233,6 @@ class NotionDiaryClient:
         """Extract date from Notion page"""
         try:
             date_str = page["properties"]["작성일"]["date"]["start"]
-            return datetime.fromisoformat(date_str)
-        except (KeyError, ValueError):
+            return parse_notion_date(date_str)
+        except (KeyError, TypeError, ValueError):
             return None
@@ -0,0 +1,198 @@
+import heapq
+import io
+import os
+import re
+import zipfile
+from datetime import datetime, tzinfo
+from typing import IO, Dict, Iterator, List, Optional, Tuple
+
+from .models import DiaryEntry
+from .notion_client import parse_notion_date, to_naive_utc
+
+DATE_PROPERTY = "작성일"
+
+# Notion appends the 32-hex page id to every exported file name
+_PAGE_ID_RE = re.compile(r"([0-9a-f]{32})\.md$")
+_PROPERTY_RE = re.compile(r"^([^:]+):\s*(.*)$")
+# Markdown lines that do not come from paragraph blocks: headings, list items,
+# to-dos, quotes, tables, images, dividers and HTML such as callouts
+_NON_PARAGRAPH_RE = re.compile(r"^(#|[-*+] |\d+\. |>|\||!\[|<|---|\*\*\*|___)")
+# Inline markup, replaced by its text so content matches the API's plain_text
+_INLINE_MARKUP_RES = [
+    (re.compile(r"!?\[([^\]]*)\]\([^)]*\)"), r"\1"),
+    (re.compile(r"(\*\*|__|~~|\*|`)(.+?)\1"), r"\2"),
+]
+
+
+class NotionExportDiaryClient:
+    def __init__(self, archive_path: str, source_timezone: Optional[tzinfo] = None):
+        self.archive_path = archive_path
+        # Exports write timed 작성일 values in the workspace's local time
+        self.source_timezone = source_timezone
+
+    def iter_entries(self) -> Iterator[DiaryEntry]:
+        """
+        Stream diary entries from a Notion markdown/CSV export archive.
+
+        Zip members are read one at a time without extracting the archive to
+        disk. Large workspace exports wrap their content in nested zips
+        ("...Part-1.zip"), which are streamed the same way. Pages without
+        content or a parsable 작성일 are skipped, matching NotionDiaryClient.
+
+        Yields:
+            DiaryEntry objects in archive order
+
+        Raises:
+            ValueError: If the archive contains no markdown pages at all
+        """
+        page_count = 0
+        with zipfile.ZipFile(self.archive_path) as archive:
+            for filename, member in self._iter_pages(archive):
+                page_count += 1
+                entry = self._parse_page(member, filename)
+                if entry:
+                    yield entry
+
+        if not page_count:
+            raise ValueError(
+                f"No markdown pages found in Notion export: {self.archive_path}"
+            )
+
+    def _iter_pages(self, archive: zipfile.ZipFile) -> Iterator[Tuple[str, IO[bytes]]]:
+        """Yield (filename, open member) for every .md page, descending into zips"""
+        for info in archive.infolist():
+            if info.is_dir():
+                continue
+            if info.filename.endswith(".zip"):
+                with archive.open(info) as nested_file:
+                    with zipfile.ZipFile(nested_file) as nested:
+                        yield from self._iter_pages(nested)
+            elif info.filename.endswith(".md"):
+                with archive.open(info) as member:
+                    yield info.filename, member
+
+    async def get_recent_entries(self, limit: int = 5) -> List[DiaryEntry]:
+        """
+        Fetch recent diary entries from the export archive
+
+        Args:
+            limit: Maximum number of entries to return
+
+        Returns:
+            List of DiaryEntry objects sorted by date (newest first)
+        """
+        return heapq.nlargest(limit, self.iter_entries(), key=lambda x: x.date)
+
+    async def get_latest_date(self) -> Optional[datetime]:
+        """
+        Find the most recent 작성일 in the export archive
+
+        Only page properties are used, so pages are not skipped for being
+        empty.
+
+        Returns:
+            The newest parsable 작성일 as naive UTC, or None if there is none
+        """
+        latest_date = None
+        with zipfile.ZipFile(self.archive_path) as archive:
+            for _, member in self._iter_pages(archive):
+                properties, _ = self._split_page(
+                    io.TextIOWrapper(member, encoding="utf-8-sig")
+                )
+                date = self._extract_date(properties)
+                if date and (latest_date is None or date > latest_date):
+                    latest_date = date
+        return latest_date
+
+    async def get_entries_in_range(
+        self, start: datetime, end: datetime
+    ) -> List[DiaryEntry]:
+        """
+        Fetch all diary entries written in [start, end) from the export archive
+
+        Args:
+            start: Inclusive lower bound of 작성일
+            end: Exclusive upper bound of 작성일
+
+        Returns:
+            List of DiaryEntry objects sorted by date (newest first)
+        """
+        start = to_naive_utc(start)
+        end = to_naive_utc(end)
+        entries = [entry for entry in self.iter_entries() if start <= entry.date < end]
+        return sorted(entries, key=lambda x: x.date, reverse=True)
+
+    def _parse_page(self, member: IO[bytes], filename: str) -> Optional[DiaryEntry]:
+        """Parse an exported markdown page into a DiaryEntry"""
+        properties, content = self._split_page(
+            io.TextIOWrapper(member, encoding="utf-8-sig")
+        )
+        date = self._extract_date(properties)
+        if not content or not date:
+            return None
+
+        return DiaryEntry(
+            content=content,
+            date=date,
+            page_id=self._extract_page_id(filename),
+        )
+
+    def _split_page(self, lines: IO[str]) -> Tuple[Dict[str, str], str]:
+        """
+        Split an exported page into its property block and paragraph text.
+
+        Exported pages start with "# Title", followed by one "Name: value"
+        line per property, a blank line, and then the page body. Only
+        paragraph lines of the body are kept, with inline markup stripped,
+        matching what NotionDiaryClient extracts through the API.
+        """
+        properties: Dict[str, str] = {}
+        contents = []
+        in_properties = True
+        in_code_block = False
+
+        for line in lines:
+            line = line.rstrip("\n")
+            if in_properties:
+                if line.startswith("# ") or not line.strip():
+                    if properties:
+                        in_properties = False
+                    continue
+                match = _PROPERTY_RE.match(line)
+                if match:
+                    properties[match.group(1).strip()] = match.group(2).strip()
+                    continue
+                in_properties = False
+
+            if line.startswith("```"):
+                in_code_block = not in_code_block
+                continue
+            if in_code_block or not line.strip() or line[0].isspace():
+                continue
+            if _NON_PARAGRAPH_RE.match(line):
+                continue
+
+            contents.append(self._strip_markup(line))
+
+        return properties, "\n".join(contents)
+
+    def _strip_markup(self, line: str) -> str:
+        """Replace inline markdown (links, emphasis, code) with its text"""
+        for pattern, replacement in _INLINE_MARKUP_RES:
+            line = pattern.sub(replacement, line)
+        return line
+
+    def _extract_date(self, properties: Dict[str, str]) -> Optional[datetime]:
+        """Extract date from exported page properties"""
+        date_str = properties.get(DATE_PROPERTY)
+        if not date_str:
+            return None
+        return parse_notion_date(date_str, self.source_timezone)
+
+    def _extract_page_id(self, filename: str) -> str:
+        """Extract the Notion page id from an exported file name"""
+        basename = os.path.basename(filename)
+        match = _PAGE_ID_RE.search(basename.replace(" ", ""))
+        if match:
+            return match.group(1)
+        return basename
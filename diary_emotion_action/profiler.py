@@ -0,0 +1,90 @@
+import cProfile
+import io
+import logging
+import os
+import pstats
+from typing import Awaitable, Callable, TypeVar
+
+from torch.profiler import ProfilerActivity, profile
+
+T = TypeVar("T")
+
+PYTHON_PROFILE_FILE = "python.prof"
+STACKS_FILE = "stacks.txt"
+CHROME_TRACE_FILE = "trace.json"
+
+logger = logging.getLogger(__name__)
+
+
+async def profile_run(
+    run: Callable[[], Awaitable[T]], output_dir: str, top: int = 20
+) -> T:
+    """
+    Run a coroutine under Python and torch operator-level profiling.
+
+    Writes the following artifacts to output_dir:
+        - python.prof: cProfile stats, loadable with pstats/snakeviz
+        - stacks.txt: collapsed stacks for flamegraph.pl / speedscope
+        - trace.json: Chrome trace (chrome://tracing, Perfetto)
+
+    Args:
+        run: Zero-argument callable returning the coroutine to profile
+        output_dir: Directory where the traces are written
+        top: Number of hottest functions/operators to print
+
+    Returns:
+        Whatever the profiled coroutine returns
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    python_profiler = cProfile.Profile()
+    torch_profiler = profile(
+        activities=[ProfilerActivity.CPU],
+        record_shapes=True,
+        with_stack=True,
+    )
+    # Traces are written even when the run fails, since failed runs are the
+    # ones most worth profiling
+    try:
+        with torch_profiler:
+            python_profiler.enable()
+            try:
+                return await run()
+            finally:
+                python_profiler.disable()
+    finally:
+        # A failing export must not replace the exception from run()
+        try:
+            write_traces(python_profiler, torch_profiler, output_dir)
+            print(summarize(python_profiler, torch_profiler, top))
+        except Exception:
+            logger.exception("Failed to write profiler traces to %s", output_dir)
+
+
+def write_traces(
+    python_profiler: cProfile.Profile, torch_profiler: profile, output_dir: str
+) -> None:
+    """Write the Python stats, collapsed stacks and Chrome trace to output_dir"""
+    python_profiler.dump_stats(os.path.join(output_dir, PYTHON_PROFILE_FILE))
+    torch_profiler.export_stacks(
+        os.path.join(output_dir, STACKS_FILE), "self_cpu_time_total"
+    )
+    torch_profiler.export_chrome_trace(os.path.join(output_dir, CHROME_TRACE_FILE))
+
+
+def summarize(
+    python_profiler: cProfile.Profile, torch_profiler: profile, top: int
+) -> str:
+    """Build a short text summary of the hottest functions and operators"""
+    stream = io.StringIO()
+    stream.write(f"Top {top} Python functions by cumulative time\n")
+    stats = pstats.Stats(python_profiler, stream=stream)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+
+    stream.write(f"Top {top} torch operators by self CPU time\n")
+    stream.write(
+        torch_profiler.key_averages().table(
+            sort_by="self_cpu_time_total", row_limit=top
+        )
+    )
+    return stream.getvalue()
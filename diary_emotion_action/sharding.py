@@ -0,0 +1,153 @@
+import json
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from .emotion_analyzer import EmotionAnalyzer, merge_partial_aggregates
+from .models import EmotionAnalysis, PartialEmotionAggregate
+from .notion_client import NotionDiaryClient, to_naive_utc
+from .notion_export import NotionExportDiaryClient
+
+
+@dataclass
+class DateShard:
+    """Half-open date range [start, end) analyzed by a single worker"""
+
+    start: datetime
+    end: datetime
+
+
+def plan_shards(start: datetime, end: datetime, num_shards: int) -> List[DateShard]:
+    """
+    Split [start, end) into contiguous, equally sized date-range shards
+
+    Bounds are normalized to naive UTC, the convention used for diary dates.
+
+    Args:
+        start: Inclusive lower bound of the history to analyze
+        end: Exclusive upper bound of the history to analyze
+        num_shards: Number of shards to produce
+
+    Returns:
+        List of DateShard objects covering [start, end) without overlap
+    """
+    start = to_naive_utc(start)
+    end = to_naive_utc(end)
+    if num_shards < 1:
+        raise ValueError("num_shards must be at least 1")
+    if end <= start:
+        raise ValueError("end must be after start")
+
+    step = (end - start) / num_shards
+    bounds = [start + step * i for i in range(num_shards)] + [end]
+    return [DateShard(bounds[i], bounds[i + 1]) for i in range(num_shards)]
+
+
+async def find_latest_date(
+    client: Union[NotionDiaryClient, NotionExportDiaryClient],
+) -> datetime:
+    """
+    Find the date of the most recent entry in the diary
+
+    Every worker must weight its shard against this same date; computing it
+    once on the coordinator and passing it to all workers guarantees that.
+    Only dates are read, so an empty newest page does not hide older ones.
+
+    Returns:
+        The most recent 작성일, as naive UTC
+    """
+    latest_date = await client.get_latest_date()
+    if latest_date is None:
+        raise ValueError("No entries provided for analysis")
+    return latest_date
+
+
+async def plan_sharded_run(
+    client: Union[NotionDiaryClient, NotionExportDiaryClient],
+    start: datetime,
+    num_shards: int,
+    end: Optional[datetime] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Plan a sharded run on the coordinator
+
+    Args:
+        client: Diary source used to find the latest date
+        start: Inclusive lower bound of the history to analyze
+        num_shards: Number of shards to produce
+        end: Exclusive upper bound; defaults to the day after the latest entry
+
+    Returns:
+        One JSON-serializable dict per shard with its start, end and the shared
+        latest_date, usable directly as a CI matrix
+    """
+    latest_date = await find_latest_date(client)
+    if end is None:
+        end = latest_date + timedelta(days=1)
+
+    return [
+        {
+            "start": shard.start.isoformat(),
+            "end": shard.end.isoformat(),
+            "latest_date": latest_date.isoformat(),
+        }
+        for shard in plan_shards(start, end, num_shards)
+    ]
+
+
+async def analyze_shard(
+    client: Union[NotionDiaryClient, NotionExportDiaryClient],
+    analyzer: EmotionAnalyzer,
+    shard: DateShard,
+    latest_date: datetime,
+) -> PartialEmotionAggregate:
+    """
+    Fetch and analyze the entries of one shard
+
+    Args:
+        client: Diary source to fetch the shard's entries from
+        analyzer: EmotionAnalyzer used for the entries
+        shard: Date range to analyze
+        latest_date: The date of the most recent entry across all shards,
+            identical for every worker
+
+    Returns:
+        PartialEmotionAggregate for the shard (empty if it has no entries)
+    """
+    entries = await client.get_entries_in_range(shard.start, shard.end)
+    return analyzer.analyze_partial(entries, to_naive_utc(latest_date))
+
+
+async def run_shard_worker(
+    client: Union[NotionDiaryClient, NotionExportDiaryClient],
+    analyzer: EmotionAnalyzer,
+    shard: DateShard,
+    latest_date: datetime,
+    output_path: str,
+) -> PartialEmotionAggregate:
+    """Analyze one shard and write its partial aggregate to output_path"""
+    partial = await analyze_shard(client, analyzer, shard, latest_date)
+    save_partial(partial, output_path)
+    return partial
+
+
+def save_partial(partial: PartialEmotionAggregate, path: str) -> None:
+    """Write a partial aggregate to a JSON file"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(partial.to_dict(), f, ensure_ascii=False)
+
+
+def load_partial(path: str) -> PartialEmotionAggregate:
+    """Read a partial aggregate written by save_partial"""
+    with open(path, encoding="utf-8") as f:
+        return PartialEmotionAggregate.from_dict(json.load(f))
+
+
+def merge_partial_files(paths: Iterable[str]) -> EmotionAnalysis:
+    """
+    Merge partial aggregate files from all workers
+
+    Returns:
+        The same EmotionAnalysis a single-node analyze_weighted run would return
+    """
+    return merge_partial_aggregates(load_partial(path) for path in paths)
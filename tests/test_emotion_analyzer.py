@@ -3,8 +3,12 @@ import torch
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch, MagicMock
 
-from diary_emotion_action.emotion_analyzer import EmotionAnalyzer
+from diary_emotion_action.emotion_analyzer import (
+    EmotionAnalyzer,
+    merge_partial_aggregates,
+)
 from diary_emotion_action.models import (
+    DiaryEntry,
     Emotion,
     EmotionAnalysis,
     WeightedEmotionResult,
@@ -102,7 +106,7 @@ class TestEmotionAnalyzer:
     def test_analyze_weighted_single_entry(self, emotion_analyzer):
         """Test weighted analysis with a single entry"""
         now = datetime.now()
-        entries = [{"content": "행복한 하루!", "date": now}]
+        entries = [DiaryEntry("행복한 하루!", now, "page")]
 
         result = emotion_analyzer.analyze_weighted(entries)
 
@@ -113,15 +117,17 @@ class TestEmotionAnalyzer:
         """Test weighted analysis with multiple entries over different days"""
         now = datetime.now()
         entries = [
-            {"content": "너무 행복해!", "date": now},  # Today - Joy
-            {
-                "content": "화가 난다.",  # Yesterday - Anger
-                "date": now - timedelta(days=1),
-            },
-            {
-                "content": "그저 그런 하루.",  # 2 days ago - Neutral
-                "date": now - timedelta(days=2),
-            },
+            DiaryEntry("너무 행복해!", now, "page"),  # Today - Joy
+            DiaryEntry(
+                content="화가 난다.",  # Yesterday - Anger
+                date=now - timedelta(days=1),
+                page_id="page",
+            ),
+            DiaryEntry(
+                content="그저 그런 하루.",  # 2 days ago - Neutral
+                date=now - timedelta(days=2),
+                page_id="page",
+            ),
         ]
 
         result = emotion_analyzer.analyze_weighted(entries)
@@ -140,8 +146,8 @@ class TestEmotionAnalyzer:
         """Test weighted analysis with multiple entries from the same day"""
         now = datetime.now()
         entries = [
-            {"content": "아침: 기분 좋아!", "date": now},
-            {"content": "점심: 피곤하다.", "date": now},
+            DiaryEntry("아침: 기분 좋아!", now, "page"),
+            DiaryEntry("점심: 피곤하다.", now, "page"),
         ]
 
         result = emotion_analyzer.analyze_weighted(entries)
@@ -153,11 +159,12 @@ class TestEmotionAnalyzer:
         """Test weighted analysis with entries that are far apart in time"""
         now = datetime.now()
         entries = [
-            {"content": "오늘은 좋은 날!", "date": now},
-            {
-                "content": "옛날 일기",
-                "date": now - timedelta(days=30),  # Entry from 30 days ago
-            },
+            DiaryEntry("오늘은 좋은 날!", now, "page"),
+            DiaryEntry(
+                content="옛날 일기",
+                date=now - timedelta(days=30),  # Entry from 30 days ago
+                page_id="page",
+            ),
         ]
 
         result = emotion_analyzer.analyze_weighted(entries)
@@ -234,15 +241,17 @@ class TestEmotionAnalyzer:
         # Create test entries over the last 5 days
         now = datetime.now()
         test_entries = [
-            {"content": "오늘은 정말 행복한 하루였다!", "date": now},  # Today - Joy
-            {
-                "content": "너무 화가난다.",  # Yesterday - Anger
-                "date": now - timedelta(days=1),
-            },
-            {
-                "content": "평범한 하루.",  # 2 days ago - Neutral
-                "date": now - timedelta(days=2),
-            },
+            DiaryEntry("오늘은 정말 행복한 하루였다!", now, "page"),  # Today - Joy
+            DiaryEntry(
+                content="너무 화가난다.",  # Yesterday - Anger
+                date=now - timedelta(days=1),
+                page_id="page",
+            ),
+            DiaryEntry(
+                content="평범한 하루.",  # 2 days ago - Neutral
+                date=now - timedelta(days=2),
+                page_id="page",
+            ),
         ]
 
         result = emotion_analyzer.analyze_weighted(test_entries)
@@ -256,3 +265,38 @@ class TestEmotionAnalyzer:
     def test_weighted_analysis_empty_entries(self, emotion_analyzer):
         with pytest.raises(ValueError):
             emotion_analyzer.analyze_weighted([])
+
+    def test_analyze_partial_merge_matches_weighted(self, emotion_analyzer):
+        """Test that merged partials reproduce the single-pass weighted result"""
+        now = datetime.now()
+        entries = [
+            DiaryEntry("오늘은 좋은 날!", now, "page1"),
+            DiaryEntry("화가 난다.", now - timedelta(days=1), "page2"),
+            DiaryEntry("그저 그런 하루.", now - timedelta(days=2), "page3"),
+            DiaryEntry("옛날 일기", now - timedelta(days=10), "page4"),
+        ]
+
+        expected = emotion_analyzer.analyze_weighted(entries)
+        partials = [
+            emotion_analyzer.analyze_partial(entries[:2], now),
+            emotion_analyzer.analyze_partial(entries[2:], now),
+            emotion_analyzer.analyze_partial([], now),
+        ]
+        result = merge_partial_aggregates(partials)
+
+        assert result.emotion == expected.emotion
+        assert result.confidence == pytest.approx(expected.confidence)
+        assert sum(len(partial.results) for partial in partials) == 4
+        assert [result.page_id for result in partials[0].results] == ["page1", "page2"]
+
+    def test_merge_partials_different_latest_dates(self, emotion_analyzer):
+        now = datetime.now()
+        partials = [
+            emotion_analyzer.analyze_partial([DiaryEntry("a", now, "page")], now),
+            emotion_analyzer.analyze_partial(
+                [DiaryEntry("b", now, "page")], now + timedelta(days=1)
+            ),
+        ]
+
+        with pytest.raises(ValueError, match="different dates"):
+            merge_partial_aggregates(partials)
@@ -0,0 +1,139 @@
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+import torch
+
+from diary_emotion_action.emotion_analyzer import EmotionAnalyzer
+from diary_emotion_action.models import DiaryEntry, Emotion, ModelEvaluation
+from diary_emotion_action.multi_model import (
+    MultiModelEvaluator,
+    format_evaluations,
+    peak_memory,
+)
+
+VOCABS = {
+    "model-a": {"[PAD]": 0, "행복": 1},
+    "model-b": {"[PAD]": 0, "행복": 1},
+    "model-c": {"[PAD]": 0, "슬픔": 1},
+    "model-d": {"[PAD]": 0, "행복": 1},
+}
+INIT_KWARGS = {
+    "model-a": {"do_lower_case": False, "name_or_path": "org/model-a"},
+    "model-b": {"do_lower_case": False, "name_or_path": "org/model-b"},
+    "model-c": {"do_lower_case": False, "name_or_path": "org/model-c"},
+    "model-d": {"do_lower_case": True, "name_or_path": "org/model-d"},
+}
+DOMINANT = {"model-a": 0, "model-b": 2, "model-c": 1, "model-d": 0}
+
+
+class FakeAnalyzer(EmotionAnalyzer):
+    def __init__(self, model_name):
+        dominant = DOMINANT[model_name]
+
+        def tokenize(texts, **kwargs):
+            size = len(texts)
+            return {
+                "input_ids": torch.ones(size, 3, dtype=torch.long),
+                "attention_mask": torch.ones(size, 3, dtype=torch.long),
+            }
+
+        def forward(input_ids, attention_mask):
+            logits = torch.zeros(input_ids.shape[0], 7)
+            logits[:, dominant] = 5.0
+            output = MagicMock()
+            output.logits = logits
+            return output
+
+        self.tokenizer = MagicMock(side_effect=tokenize)
+        self.tokenizer.get_vocab.return_value = VOCABS[model_name]
+        self.tokenizer.init_kwargs = INIT_KWARGS[model_name]
+        self.tokenizer.special_tokens_map = {"pad_token": "[PAD]"}
+        self.tokenizer.is_fast = False
+        self.model = MagicMock(side_effect=forward)
+        self.model.parameters.return_value = [torch.zeros(10, 10)]
+        self.model.buffers.return_value = [torch.zeros(5)]
+        self.device = "cpu"
+        self.idx_to_emotion = list(Emotion)
+
+
+@pytest.fixture
+def evaluator():
+    with patch("diary_emotion_action.multi_model.EmotionAnalyzer", FakeAnalyzer):
+        return MultiModelEvaluator(
+            ["model-a", "model-b", "model-c", "model-d"], batch_size=2
+        )
+
+
+@pytest.fixture
+def entries():
+    now = datetime(2024, 2, 28)
+    return [
+        DiaryEntry(f"일기 {i}", now - timedelta(days=i), f"page{i}") for i in range(5)
+    ]
+
+
+@pytest.mark.parametrize("concurrent", [True, False])
+def test_evaluate_side_by_side(evaluator, entries, concurrent):
+    evaluations = evaluator.evaluate(entries, concurrent=concurrent)
+
+    assert [evaluation.model_name for evaluation in evaluations] == [
+        "model-a",
+        "model-b",
+        "model-c",
+        "model-d",
+    ]
+    assert all(isinstance(evaluation, ModelEvaluation) for evaluation in evaluations)
+    assert evaluations[0].analysis.emotion == Emotion.JOY
+    assert evaluations[1].analysis.emotion == Emotion.ANGER
+    assert evaluations[2].analysis.emotion == Emotion.SADNESS
+    assert all(len(evaluation.results) == 5 for evaluation in evaluations)
+    assert all(evaluation.parameter_bytes == 420 for evaluation in evaluations)
+    assert all(evaluation.peak_inference_bytes >= 0 for evaluation in evaluations)
+    assert evaluations[0].results[0].page_id == "page0"
+    assert all(evaluation.elapsed_seconds >= 0 for evaluation in evaluations)
+
+
+def test_evaluate_tokenizes_once_per_tokenizer(evaluator, entries):
+    evaluator.evaluate(entries)
+
+    calls = {
+        name: analyzer.tokenizer.call_count
+        for name, analyzer in evaluator.analyzers.items()
+    }
+    # model-a and model-b share a tokenizer; 5 entries in batches of 2
+    assert calls["model-a"] + calls["model-b"] == 3
+    # model-c has another vocabulary, model-d lowercases the same vocabulary
+    assert calls["model-c"] == 3
+    assert calls["model-d"] == 3
+
+
+def test_evaluate_restores_num_threads(evaluator, entries):
+    num_threads = torch.get_num_threads()
+
+    evaluator.evaluate(entries, concurrent=True)
+
+    assert torch.get_num_threads() == num_threads
+
+
+def test_peak_memory():
+    events = [
+        MagicMock(self_cpu_memory_usage=100, time_range=MagicMock(start=1)),
+        MagicMock(self_cpu_memory_usage=-100, time_range=MagicMock(start=3)),
+        MagicMock(self_cpu_memory_usage=50, time_range=MagicMock(start=2)),
+    ]
+
+    assert peak_memory(events) == 150
+
+
+def test_evaluate_empty_entries(evaluator):
+    with pytest.raises(ValueError, match="No entries provided for analysis"):
+        evaluator.evaluate([])
+
+
+def test_format_evaluations(evaluator, entries):
+    summary = format_evaluations(evaluator.evaluate(entries))
+
+    assert "model-a" in summary
+    assert "joy" in summary
+    assert "sadness" in summary
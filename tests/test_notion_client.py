@@ -1,12 +1,13 @@
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
-from notion_client import AsyncClient
+from notion_client import APIResponseError, AsyncClient
 from httpx import HTTPStatusError
 
 from diary_emotion_action.models import DiaryEntry
-from diary_emotion_action.notion_client import NotionDiaryClient
+from diary_emotion_action.notion_client import NotionDiaryClient, OrjsonAsyncClient
 
 
 @pytest.fixture
@@ -50,7 +51,10 @@ def mock_notion_client():
 
 @pytest.fixture
 def notion_client(mock_notion_client):
-    with patch("diary_emotion_action.notion_client.AsyncClient", return_value=mock_notion_client):
+    with patch(
+        "diary_emotion_action.notion_client.OrjsonAsyncClient",
+        return_value=mock_notion_client,
+    ):
         return NotionDiaryClient("fake-token", "fake-db-id")
 
 
@@ -61,14 +65,14 @@ async def test_get_recent_entries(notion_client):
     assert len(entries) == 1
     assert isinstance(entries[0], DiaryEntry)
     assert entries[0].content == "Test diary entry"
-    assert entries[0].date == datetime.fromisoformat("2024-02-28T00:00:00Z")
+    assert entries[0].date == datetime(2024, 2, 28)
 
 
 @pytest.mark.asyncio
 async def test_get_recent_entries_unauthorized():
     """Test handling of unauthorized access"""
     # Create a new client instance for this test
-    with patch("diary_emotion_action.notion_client.AsyncClient") as MockClient:
+    with patch("diary_emotion_action.notion_client.OrjsonAsyncClient") as MockClient:
         mock_client = AsyncMock()
         mock_databases = AsyncMock()
         mock_databases.query.side_effect = HTTPStatusError(
@@ -84,3 +88,120 @@ async def test_get_recent_entries_unauthorized():
 
         with pytest.raises(HTTPStatusError):
             await client.get_recent_entries(limit=1)
+
+
+@pytest.mark.asyncio
+async def test_get_entries_in_range_paginates():
+    """Test that all result pages are fetched and timed dates become naive UTC"""
+
+    def page(page_id, date):
+        return {"id": page_id, "properties": {"작성일": {"date": {"start": date}}}}
+
+    responses = [
+        {
+            "results": [page("page1", "2024-02-28T15:00:00.000+09:00")],
+            "has_more": True,
+            "next_cursor": "cursor-1",
+        },
+        {
+            "results": [
+                page("page2", "2024-02-27"),
+                page("page3", "2024-01-01T00:00:00.000Z"),
+            ],
+            "has_more": False,
+            "next_cursor": None,
+        },
+    ]
+
+    with patch("diary_emotion_action.notion_client.OrjsonAsyncClient") as MockClient:
+        mock_client = MagicMock()
+        mock_client.databases.query = AsyncMock(side_effect=responses)
+        paragraph = {"rich_text": [{"plain_text": "일기"}]}
+        mock_client.blocks.children.list = AsyncMock(
+            return_value={"results": [{"type": "paragraph", "paragraph": paragraph}]}
+        )
+        MockClient.return_value = mock_client
+
+        client = NotionDiaryClient("fake-token", "fake-db-id")
+        entries = await client.get_entries_in_range(
+            datetime(2024, 2, 1), datetime(2024, 3, 1)
+        )
+
+    assert [entry.page_id for entry in entries] == ["page1", "page2"]
+    assert entries[0].date == datetime(2024, 2, 28, 6, 0)
+    assert entries[0].date.tzinfo is None
+
+    calls = mock_client.databases.query.await_args_list
+    assert len(calls) == 2
+    assert "start_cursor" not in calls[0].kwargs
+    assert calls[1].kwargs["start_cursor"] == "cursor-1"
+
+
+def test_orjson_client_parses_success_response():
+    client = OrjsonAsyncClient(auth="fake-token")
+    request = httpx.Request("POST", "https://api.notion.com/v1/databases/db/query")
+    body = {"results": [{"id": "page1"}], "has_more": False, "next_cursor": None}
+    response = httpx.Response(200, json=body, request=request)
+
+    assert client._parse_response(response) == body
+
+
+def test_orjson_client_raises_api_error():
+    client = OrjsonAsyncClient(auth="fake-token")
+    request = httpx.Request("POST", "https://api.notion.com/v1/databases/db/query")
+    response = httpx.Response(
+        401,
+        json={
+            "object": "error",
+            "status": 401,
+            "code": "unauthorized",
+            "message": "API token is invalid.",
+        },
+        request=request,
+    )
+
+    with pytest.raises(APIResponseError) as error:
+        client._parse_response(response)
+    assert error.value.code == "unauthorized"
+
+
+@pytest.mark.asyncio
+async def test_get_latest_date_skips_undated_pages_without_fetching_content():
+    """Test that the newest dated page wins even if it is empty"""
+    responses = [
+        {
+            "results": [{"id": "draft", "properties": {"작성일": {"date": None}}}],
+            "has_more": True,
+            "next_cursor": "cursor-1",
+        },
+        {
+            "results": [
+                {
+                    "id": "empty",
+                    "properties": {
+                        "작성일": {"date": {"start": "2024-02-28T15:00:00.000+09:00"}}
+                    },
+                },
+                {
+                    "id": "older",
+                    "properties": {"작성일": {"date": {"start": "2024-02-27"}}},
+                },
+            ],
+            "has_more": False,
+            "next_cursor": None,
+        },
+    ]
+
+    with patch("diary_emotion_action.notion_client.OrjsonAsyncClient") as MockClient:
+        mock_client = MagicMock()
+        mock_client.databases.query = AsyncMock(side_effect=responses)
+        mock_client.blocks.children.list = AsyncMock(return_value={"results": []})
+        MockClient.return_value = mock_client
+
+        client = NotionDiaryClient("fake-token", "fake-db-id")
+        latest_date = await client.get_latest_date()
+
+    assert latest_date == datetime(2024, 2, 28, 6, 0)
+    mock_client.blocks.children.list.assert_not_awaited()
+    calls = mock_client.databases.query.await_args_list
+    assert calls[1].kwargs["start_cursor"] == "cursor-1"
@@ -0,0 +1,145 @@
+import io
+import zipfile
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from diary_emotion_action.models import DiaryEntry
+from diary_emotion_action.notion_client import parse_notion_date
+from diary_emotion_action.notion_export import NotionExportDiaryClient
+
+PAGE_ID_1 = "0123456789abcdef0123456789abcdef"
+PAGE_ID_2 = "fedcba9876543210fedcba9876543210"
+PAGE_ID_3 = "00112233445566778899aabbccddeeff"
+
+
+@pytest.fixture
+def export_archive(tmp_path):
+    path = tmp_path / "export.zip"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr(
+            f"Diary/첫 번째 일기 {PAGE_ID_1}.md",
+            "# 첫 번째 일기\n\n작성일: 2024년 2월 27일\n\n오늘은 행복했다.\n\n내일도 좋겠다.\n",
+        )
+        archive.writestr(
+            f"Diary/마크다운 일기 {PAGE_ID_3}.md",
+            "# 마크다운 일기\n\n작성일: 2024년 2월 20일\n\n"
+            "## 아침\n\n**정말** [즐거운](https://example.com) 하루.\n\n"
+            "- 할 일\n- [ ] 운동\n\n![](image.png)\n\n| a | b |\n\n"
+            "```\ncode\n```\n\n> 인용\n\n끝.\n",
+        )
+        archive.writestr(
+            f"Diary/두 번째 일기 {PAGE_ID_2}.md",
+            "# 두 번째 일기\n\n작성일: February 28, 2024 3:00 PM\n\n화가 난다.\n",
+        )
+        archive.writestr(
+            "Diary/잘못된 날짜.md",
+            "# 잘못된 날짜\n\n작성일: 2024년 13월 1일\n\n날짜가 잘못된 페이지\n",
+        )
+        archive.writestr(
+            "Diary/날짜 없음.md",
+            "# 날짜 없음\n\n태그: 메모\n\n날짜가 없는 페이지\n",
+        )
+        archive.writestr("Diary.csv", "Name,작성일\n")
+    return path
+
+
+def test_iter_entries(export_archive):
+    client = NotionExportDiaryClient(str(export_archive))
+    entries = list(client.iter_entries())
+
+    assert len(entries) == 3
+    assert all(isinstance(entry, DiaryEntry) for entry in entries)
+    assert entries[0].content == "오늘은 행복했다.\n내일도 좋겠다."
+    assert entries[0].date == datetime(2024, 2, 27)
+    assert entries[0].page_id == PAGE_ID_1
+
+
+def test_iter_entries_keeps_only_paragraph_text(export_archive):
+    client = NotionExportDiaryClient(str(export_archive))
+    entry = next(entry for entry in client.iter_entries() if entry.page_id == PAGE_ID_3)
+
+    assert entry.content == "정말 즐거운 하루.\n끝."
+
+
+@pytest.mark.asyncio
+async def test_get_recent_entries(export_archive):
+    client = NotionExportDiaryClient(str(export_archive))
+    entries = await client.get_recent_entries(limit=1)
+
+    assert len(entries) == 1
+    assert entries[0].page_id == PAGE_ID_2
+    assert entries[0].date == datetime(2024, 2, 28, 15, 0)
+
+
+@pytest.mark.asyncio
+async def test_get_recent_entries_source_timezone(export_archive):
+    client = NotionExportDiaryClient(str(export_archive), ZoneInfo("Asia/Seoul"))
+    entries = await client.get_recent_entries(limit=2)
+
+    # Timed values are converted to UTC; date-only values stay at midnight
+    assert entries[0].date == datetime(2024, 2, 28, 6, 0)
+    assert entries[1].date == datetime(2024, 2, 27)
+
+
+@pytest.mark.asyncio
+async def test_get_latest_date_includes_empty_pages(tmp_path):
+    path = tmp_path / "export.zip"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr(
+            f"Diary/빈 일기 {PAGE_ID_2}.md", "# 빈 일기\n\n작성일: 2024년 3월 1일\n"
+        )
+        archive.writestr(
+            f"Diary/첫 번째 일기 {PAGE_ID_1}.md",
+            "# 첫 번째 일기\n\n작성일: 2024년 2월 27일\n\n오늘은 행복했다.\n",
+        )
+
+    client = NotionExportDiaryClient(str(path))
+
+    assert await client.get_latest_date() == datetime(2024, 3, 1)
+
+
+@pytest.mark.parametrize(
+    "date_str,expected",
+    [
+        ("2024-02-28", datetime(2024, 2, 28)),
+        ("2024년 2월 28일", datetime(2024, 2, 28)),
+        ("2024년 2월 28일 오후 3:05", datetime(2024, 2, 28, 15, 5)),
+        ("2024년 2월 28일 오전 12:30", datetime(2024, 2, 28, 0, 30)),
+        ("February 28, 2024", datetime(2024, 2, 28)),
+        ("February 28, 2024 → March 1, 2024", datetime(2024, 2, 28)),
+        ("2024년 13월 1일", None),
+        ("2023년 2월 29일", None),
+        ("2024년 2월 28일 오후 13:00", None),
+        ("not a date", None),
+    ],
+)
+def test_parse_notion_date(date_str, expected):
+    assert parse_notion_date(date_str) == expected
+
+
+def test_iter_entries_nested_archives(tmp_path):
+    inner = io.BytesIO()
+    with zipfile.ZipFile(inner, "w") as archive:
+        archive.writestr(
+            f"Diary/첫 번째 일기 {PAGE_ID_1}.md",
+            "# 첫 번째 일기\n\n작성일: 2024년 2월 27일\n\n오늘은 행복했다.\n",
+        )
+
+    path = tmp_path / "export.zip"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("Export-abc-Part-1.zip", inner.getvalue())
+
+    entries = list(NotionExportDiaryClient(str(path)).iter_entries())
+
+    assert [entry.page_id for entry in entries] == [PAGE_ID_1]
+
+
+def test_iter_entries_without_pages(tmp_path):
+    path = tmp_path / "export.zip"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr("Diary.csv", "Name,작성일\n")
+
+    with pytest.raises(ValueError, match="No markdown pages found"):
+        list(NotionExportDiaryClient(str(path)).iter_entries())
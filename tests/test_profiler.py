@@ -0,0 +1,70 @@
+import os
+from unittest.mock import patch
+
+import pytest
+import torch
+
+from diary_emotion_action.profiler import (
+    CHROME_TRACE_FILE,
+    PYTHON_PROFILE_FILE,
+    STACKS_FILE,
+    profile_run,
+)
+
+
+@pytest.mark.asyncio
+async def test_profile_run_writes_traces(tmp_path, capsys):
+    async def run():
+        torch.softmax(torch.randn(4, 7), dim=1)
+        return True
+
+    result = await profile_run(run, str(tmp_path), top=5)
+
+    assert result is True
+    assert os.path.exists(tmp_path / PYTHON_PROFILE_FILE)
+    assert os.path.exists(tmp_path / STACKS_FILE)
+    assert os.path.exists(tmp_path / CHROME_TRACE_FILE)
+
+    summary = capsys.readouterr().out
+    assert "Python functions" in summary
+    assert "torch operators" in summary
+
+
+@pytest.mark.asyncio
+async def test_profile_run_writes_traces_on_error(tmp_path):
+    async def run():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await profile_run(run, str(tmp_path))
+
+    assert os.path.exists(tmp_path / PYTHON_PROFILE_FILE)
+    assert os.path.exists(tmp_path / STACKS_FILE)
+    assert os.path.exists(tmp_path / CHROME_TRACE_FILE)
+
+
+@pytest.mark.asyncio
+async def test_profile_run_keeps_run_error_when_export_fails(tmp_path, caplog):
+    async def run():
+        raise RuntimeError("boom")
+
+    with patch(
+        "diary_emotion_action.profiler.write_traces",
+        side_effect=OSError("disk full"),
+    ):
+        with pytest.raises(RuntimeError, match="boom"):
+            await profile_run(run, str(tmp_path))
+
+    assert "Failed to write profiler traces" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_profile_run_returns_result_when_export_fails(tmp_path):
+    async def run():
+        return True
+
+    with patch(
+        "diary_emotion_action.profiler.write_traces",
+        side_effect=OSError("disk full"),
+    ):
+        assert await profile_run(run, str(tmp_path)) is True
@@ -0,0 +1,131 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from diary_emotion_action.models import (
+    DiaryEntry,
+    Emotion,
+    PartialEmotionAggregate,
+    WeightedEmotionResult,
+)
+from diary_emotion_action.sharding import (
+    DateShard,
+    find_latest_date,
+    load_partial,
+    merge_partial_files,
+    plan_sharded_run,
+    plan_shards,
+    run_shard_worker,
+    save_partial,
+)
+
+
+def test_plan_shards_covers_range():
+    start = datetime(2024, 1, 1)
+    end = datetime(2024, 1, 11)
+
+    shards = plan_shards(start, end, 3)
+
+    assert len(shards) == 3
+    assert shards[0].start == start
+    assert shards[-1].end == end
+    assert all(shards[i].end == shards[i + 1].start for i in range(2))
+
+
+def test_plan_shards_normalizes_aware_bounds():
+    kst = timezone(timedelta(hours=9))
+    start = datetime(2024, 1, 1, 9, tzinfo=kst)
+    end = datetime(2024, 1, 3, 9, tzinfo=kst)
+
+    shards = plan_shards(start, end, 2)
+
+    assert shards[0].start == datetime(2024, 1, 1)
+    assert shards[-1].end == datetime(2024, 1, 3)
+    assert shards[0].start.tzinfo is None
+
+
+@pytest.mark.asyncio
+async def test_find_latest_date():
+    client = AsyncMock()
+    client.get_latest_date.return_value = datetime(2024, 2, 28, 6)
+
+    assert await find_latest_date(client) == datetime(2024, 2, 28, 6)
+    client.get_recent_entries.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_find_latest_date_empty():
+    client = AsyncMock()
+    client.get_latest_date.return_value = None
+
+    with pytest.raises(ValueError):
+        await find_latest_date(client)
+
+
+@pytest.mark.asyncio
+async def test_plan_sharded_run():
+    client = AsyncMock()
+    client.get_latest_date.return_value = datetime(2024, 1, 10, 6)
+
+    plan = await plan_sharded_run(client, datetime(2024, 1, 1, 6), 3)
+
+    assert len(plan) == 3
+    assert plan[0]["start"] == "2024-01-01T06:00:00"
+    assert plan[-1]["end"] == "2024-01-11T06:00:00"
+    assert {shard["latest_date"] for shard in plan} == {"2024-01-10T06:00:00"}
+
+
+@pytest.mark.asyncio
+async def test_run_shard_worker(tmp_path):
+    latest = datetime(2024, 2, 28)
+    entries = [DiaryEntry("오늘", latest, "page1")]
+    client = AsyncMock()
+    client.get_entries_in_range.return_value = entries
+    analyzer = MagicMock()
+    partial = PartialEmotionAggregate(latest_date=latest)
+    analyzer.analyze_partial.return_value = partial
+    output = str(tmp_path / "partial.json")
+
+    shard = DateShard(datetime(2024, 2, 1), datetime(2024, 3, 1))
+    result = await run_shard_worker(client, analyzer, shard, latest, output)
+
+    assert result is partial
+    assert load_partial(output) == partial
+    client.get_entries_in_range.assert_awaited_once_with(shard.start, shard.end)
+    analyzer.analyze_partial.assert_called_once_with(entries, latest)
+
+
+def test_plan_shards_invalid():
+    with pytest.raises(ValueError):
+        plan_shards(datetime(2024, 1, 1), datetime(2024, 1, 2), 0)
+    with pytest.raises(ValueError):
+        plan_shards(datetime(2024, 1, 2), datetime(2024, 1, 1), 2)
+
+
+def test_partial_round_trip_and_merge(tmp_path):
+    latest = datetime(2024, 2, 28)
+    joy = PartialEmotionAggregate(latest_date=latest)
+    joy.emotion_scores[Emotion.JOY] = 0.9
+    joy.total_weight = 1.0
+    joy.results.append(WeightedEmotionResult(Emotion.JOY, 0.9, 1.0, latest, "page1"))
+
+    anger = PartialEmotionAggregate(latest_date=latest)
+    anger.emotion_scores[Emotion.ANGER] = 0.4
+    anger.total_weight = 0.5
+    anger.results.append(
+        WeightedEmotionResult(Emotion.ANGER, 0.8, 0.5, datetime(2024, 2, 25), "page2")
+    )
+
+    paths = []
+    for i, partial in enumerate([joy, anger]):
+        path = str(tmp_path / f"partial-{i}.json")
+        save_partial(partial, path)
+        paths.append(path)
+
+    assert load_partial(paths[1]) == anger
+    assert load_partial(paths[1]).results[0].page_id == "page2"
+
+    result = merge_partial_files(paths)
+    assert result.emotion == Emotion.JOY
+    assert result.confidence == pytest.approx(0.9 / 1.5)